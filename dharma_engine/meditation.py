@@ -9,11 +9,25 @@
 """
 
 import math
-import random
+import sys
 import time
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
-from enum import Enum
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, fields as dataclass_fields
+from enum import Enum, IntEnum
+
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba 为可选加速依赖，缺失时退回纯 Python
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
 
 
 class HindranceType(Enum):
@@ -25,20 +39,30 @@ class HindranceType(Enum):
     DOUBT = "疑盖"                 # vicikicchā
 
 
-class NineStages(Enum):
-    """九住心"""
-    INNER_ABIDING = "内住"           # 1. 能稳定10-20秒
-    CONTINUOUS_ABIDING = "等住"      # 2. 断线后能快速回来
-    RESTORATIVE_ABIDING = "安住"     # 3. 减少长时间走神
-    CLOSE_ABIDING = "近住"           # 4. 很少完全忘掉所缘
-    TAMING = "调伏"                  # 5. 能压住掉举
-    PACIFYING = "寂静"               # 6. 止息细微烦恼波
-    FULLY_PACIFYING = "最极寂静"     # 7. 细微掉举都能察觉
-    SINGLE_POINTED = "一趣"          # 8. 长时间一境
-    EQUIPOISE = "等持"               # 9. 稳且明，不靠硬顶
+class NineStages(IntEnum):
+    """九住心（整数段位，名称见 label / _STAGE_NAMES）"""
+    INNER_ABIDING = 0        # 1. 内住：能稳定10-20秒
+    CONTINUOUS_ABIDING = 1   # 2. 等住：断线后能快速回来
+    RESTORATIVE_ABIDING = 2  # 3. 安住：减少长时间走神
+    CLOSE_ABIDING = 3        # 4. 近住：很少完全忘掉所缘
+    TAMING = 4               # 5. 调伏：能压住掉举
+    PACIFYING = 5            # 6. 寂静：止息细微烦恼波
+    FULLY_PACIFYING = 6      # 7. 最极寂静：细微掉举都能察觉
+    SINGLE_POINTED = 7       # 8. 一趣：长时间一境
+    EQUIPOISE = 8            # 9. 等持：稳且明，不靠硬顶
+
+    @property
+    def label(self) -> str:
+        """中文段位名"""
+        return _STAGE_NAMES[self]
+
 
+# 按段位整数索引的中文名（热路径只做整数比较，显示时才查表）
+_STAGE_NAMES = ("内住", "等住", "安住", "近住", "调伏",
+                "寂静", "最极寂静", "一趣", "等持")
 
-@dataclass
+
+@dataclass(slots=True)
 class Hindrance:
     """盖的定义"""
     type: HindranceType
@@ -108,7 +132,221 @@ FIVE_HINDRANCES: Dict[str, Hindrance] = {
 }
 
 
-@dataclass
+# 种子数组的固定索引（前 5 个与盖的顺序一致）
+# id 字符串统一驻留：用作 dict 键时可走指针同一性短路，
+# 调用方传入的同名字面量也会命中同一对象
+_SEED_ORDER = tuple(sys.intern(s) for s in (
+    "sloth_torpor", "restlessness", "sensual_desire", "ill_will", "doubt",
+    "mindfulness", "concentration", "diligence", "tranquility", "equanimity",
+))
+_SEED_INDEX = {name: i for i, name in enumerate(_SEED_ORDER)}
+
+IDX_SLOTH_TORPOR = 0
+IDX_RESTLESSNESS = 1
+IDX_SENSUAL_DESIRE = 2
+IDX_ILL_WILL = 3
+IDX_DOUBT = 4
+IDX_MINDFULNESS = 5
+
+# 别境五数组的固定索引
+_PARTICULAR_ORDER = tuple(sys.intern(s) for s in (
+    "chanda", "adhimoksa", "smrti", "samadhi", "prajna"))
+_PARTICULAR_INDEX = {name: i for i, name in enumerate(_PARTICULAR_ORDER)}
+IDX_CHANDA = 0
+IDX_ADHIMOKSA = 1
+IDX_SMRTI = 2
+IDX_SAMADHI = 3
+IDX_PRAJNA = 4
+
+# 盖在数组中的顺序（= _SEED_ORDER 前 5 项）
+_HINDRANCE_ORDER = _SEED_ORDER[:5]
+
+# 随机数池的槽位：每秒一行，走神判定占 0 号，5 盖占 1-5 号
+WANDER_SLOT = 0
+HINDRANCE_SLOT0 = 1
+_N_RAND_SLOTS = 8
+
+# 五盖的 SoA 常量数组（FIVE_HINDRANCES 仅保留给演示/展示用途）
+_STAB_DMG = np.array(
+    [FIVE_HINDRANCES[h].stability_damage for h in _HINDRANCE_ORDER],
+    dtype=np.float32)
+_CLAR_DMG = np.array(
+    [FIVE_HINDRANCES[h].clarity_damage for h in _HINDRANCE_ORDER],
+    dtype=np.float32)
+_HINDRANCE_NAMES = tuple(
+    FIVE_HINDRANCES[h].name for h in _HINDRANCE_ORDER)
+
+
+@njit(cache=True, fastmath=True)
+def _tick_numeric_core(seeds_arr, smrti, fatigue, rand5, strengths,
+                       stability, clarity, base_stab, base_clar,
+                       stab_dmg, clar_dmg):
+    """
+    每秒数值核心：5 盖压力/激活 + 稳定度/明晰度更新，单趟融合
+
+    原地把新激活的盖写入 strengths；压力向量不再物化，
+    只保留真正被用到的两个标量（掉举压力、惛沉压力）。
+    """
+    activated = np.zeros(5, dtype=np.bool_)
+    restless_p = 0.0
+    sloth_p = 0.0
+
+    # 向基础值缓慢回归
+    stability += (base_stab - stability) * 0.05
+    clarity += (base_clar - clarity) * 0.05
+
+    for i in range(5):
+        base = seeds_arr[i] - smrti * 0.2
+
+        # 惛沉随时间增加，掉举在开始时较高
+        if i == IDX_SLOTH_TORPOR:
+            base += fatigue * 0.2
+        elif i == IDX_RESTLESSNESS:
+            base += (1.0 - fatigue) * 0.1
+
+        p = base
+        if p < 0.0:
+            p = 0.0
+        elif p > 1.0:
+            p = 1.0
+        if i == IDX_RESTLESSNESS:
+            restless_p = p
+        elif i == IDX_SLOTH_TORPOR:
+            sloth_p = p
+
+        # 超过阈值则按概率现起
+        if base > 0.6 and rand5[i] < base * 0.1 and strengths[i] == 0.0:
+            strengths[i] = base
+            activated[i] = True
+
+        # 盖的损害
+        s = strengths[i]
+        if s > 0.0:
+            stability -= stab_dmg[i] * s * 0.1
+            clarity -= clar_dmg[i] * s * 0.1
+
+    # 掉举压力直接损害稳定，惛沉压力直接损害明晰
+    stability -= restless_p * 0.05
+    clarity -= sloth_p * 0.05
+
+    # 限制范围
+    if stability < 0.1:
+        stability = 0.1
+    elif stability > 0.95:
+        stability = 0.95
+    if clarity < 0.1:
+        clarity = 0.1
+    elif clarity > 0.95:
+        clarity = 0.95
+
+    return stability, clarity, activated
+
+
+# 缓存已生成的专用核心，键为 (本局时长, smrti)
+_SPEC_CACHE: Dict[Tuple[int, float], Callable] = {}
+
+
+def _build_tick_spec(session_duration: int, smrti: float) -> Callable:
+    """
+    exec 生成本局专用的数值核心（无 numba 时的纯 Python 路径）
+
+    仿照 dataclass 生成 __init__ 的做法：把 5 盖循环展开，
+    损害系数、smrti 压制量、疲劳斜率等本局不变量全部内联成字面量，
+    编译一次后整局复用。
+    """
+    key = (session_duration, round(float(smrti), 6))
+    fn = _SPEC_CACHE.get(key)
+    if fn is not None:
+        return fn
+
+    inv_t = 1.0 / session_duration
+    suppress = float(smrti) * 0.2
+
+    lines = [
+        "def _tick_spec(seeds, strengths, stability, clarity,",
+        "               base_stab, base_clar, t, rand5):",
+        "    fatigue = t * %r" % inv_t,
+        "    if fatigue > 1.0:",
+        "        fatigue = 1.0",
+        "    stability += (base_stab - stability) * 0.05",
+        "    clarity += (base_clar - clarity) * 0.05",
+        "    restless_p = 0.0",
+        "    sloth_p = 0.0",
+        "    activated = [False, False, False, False, False]",
+    ]
+    for i in range(5):
+        if i == IDX_SLOTH_TORPOR:
+            adj = " + fatigue * 0.2"
+        elif i == IDX_RESTLESSNESS:
+            adj = " + (1.0 - fatigue) * 0.1"
+        else:
+            adj = ""
+        lines.append("    base = seeds[%d] - %r%s" % (i, suppress, adj))
+        lines.append(
+            "    p = 0.0 if base < 0.0 else (1.0 if base > 1.0 else base)")
+        if i == IDX_RESTLESSNESS:
+            lines.append("    restless_p = p")
+        elif i == IDX_SLOTH_TORPOR:
+            lines.append("    sloth_p = p")
+        lines += [
+            "    if base > 0.6 and rand5[%d] < base * 0.1 "
+            "and strengths[%d] == 0.0:" % (i, i),
+            "        strengths[%d] = base" % i,
+            "        activated[%d] = True" % i,
+            "    s = strengths[%d]" % i,
+            "    if s > 0.0:",
+            "        stability -= %r * s" % (float(_STAB_DMG[i]) * 0.1),
+            "        clarity -= %r * s" % (float(_CLAR_DMG[i]) * 0.1),
+        ]
+    lines += [
+        "    stability -= restless_p * 0.05",
+        "    clarity -= sloth_p * 0.05",
+        "    if stability < 0.1:",
+        "        stability = 0.1",
+        "    elif stability > 0.95:",
+        "        stability = 0.95",
+        "    if clarity < 0.1:",
+        "        clarity = 0.1",
+        "    elif clarity > 0.95:",
+        "        clarity = 0.95",
+        "    return stability, clarity, activated",
+    ]
+
+    namespace: Dict = {}
+    exec(compile("\n".join(lines), "<tick_spec>", "exec"), namespace)
+    fn = namespace["_tick_spec"]
+    _SPEC_CACHE[key] = fn
+    return fn
+
+
+@njit(cache=True, fastmath=True)
+def _fast_sigmoid(x):
+    """sigmoid(x) = 0.5 * (1 + tanh(x/2))
+
+    恒等变形：tanh 是 C 级内建，在多数 libm 上快于 exp，
+    且天然有界，省掉大负数时 exp 溢出的分支。
+    """
+    return 0.5 * (1.0 + math.tanh(x * 0.5))
+
+
+@njit(cache=True, fastmath=True)
+def _wander_prob_core(stability, restless_seed, smrti):
+    """走神概率（sigmoid）"""
+    x = -stability * 2.0 + restless_seed - smrti
+    return _fast_sigmoid(x) * 0.05
+
+
+if _HAVE_NUMBA:
+    # 导入时预热一次，触发编译并写入磁盘缓存（cache=True），
+    # 避免第一次 tick 时的编译停顿
+    _z5 = np.zeros(5, dtype=np.float32)
+    _tick_numeric_core(np.zeros(10, dtype=np.float32), 0.5, 0.0,
+                       _z5, _z5.copy(), 0.5, 0.5, 0.5, 0.5, _z5, _z5)
+    _wander_prob_core(0.5, 0.5, 0.5)
+    del _z5
+
+
+@dataclass(slots=True)
 class MeditationState:
     """禅修状态（每秒更新）"""
     # 双轴核心
@@ -120,8 +358,9 @@ class MeditationState:
     wandering_duration: float = 0.0  # 走神持续时间（秒）
     noticing_latency: float = 0.0    # 觉知延迟（秒）
     
-    # 当前激活的盖
-    active_hindrances: Dict[str, float] = field(default_factory=dict)
+    # 当前激活的盖：按 _HINDRANCE_ORDER 索引的强度向量，0 表示未激活
+    active_hindrances: np.ndarray = field(
+        default_factory=lambda: np.zeros(5, dtype=np.float32))
     
     # 状态标记
     is_dull: bool = False       # 惛沉中
@@ -129,7 +368,7 @@ class MeditationState:
     is_wandering: bool = False  # 走神中
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStats:
     """一局统计"""
     duration_seconds: int = 0
@@ -153,8 +392,27 @@ class SessionStats:
     # 用于计算
     on_object_time: float = 0.0
     clarity_time: float = 0.0
-    noticing_latencies: List[float] = field(default_factory=list)
-    recovery_times: List[float] = field(default_factory=list)
+    noticing_latency_sum: float = 0.0
+    noticing_latency_count: int = 0
+    recovery_time_sum: float = 0.0
+    recovery_time_count: int = 0
+
+    def _asdict_fast(self) -> Dict:
+        """浅转 dict：按缓存的字段名元组取值，避开 asdict 的递归开销"""
+        return {n: getattr(self, n) for n in self.__dataclass_field_names__}
+
+
+# 字段名在类创建后缓存一次（字符串驻留，利于消费方的 dict 哈希）
+SessionStats.__dataclass_field_names__ = tuple(
+    sys.intern(f.name) for f in dataclass_fields(SessionStats))
+
+# end_session 对外暴露的统计键
+_PUBLIC_STAT_KEYS = (
+    "on_object_ratio", "clarity_ratio",
+    "avg_noticing_latency", "avg_recovery_time",
+    "oscillation_count", "wander_count", "return_count",
+    "dull_episodes", "restless_episodes",
+)
 
 
 # 九住心段位阈值
@@ -199,6 +457,28 @@ STAGE_THRESHOLDS = {
     },
 }
 
+# 段位判定用的并行阈值数组（按 NineStages 顺序）。
+# 无约束的维度填 0 / inf 哨兵，使比较恒真，判定退化为一次向量比较。
+_STAGES_LIST = tuple(NineStages)
+_STAGE_ON_OBJECT = np.array(
+    [STAGE_THRESHOLDS[s].get("on_object_ratio", 0.0) for s in _STAGES_LIST])
+_STAGE_CLARITY = np.array(
+    [STAGE_THRESHOLDS[s].get("clarity_ratio", 0.0) for s in _STAGES_LIST])
+_STAGE_LATENCY = np.array(
+    [STAGE_THRESHOLDS[s].get("avg_noticing_latency", np.inf)
+     for s in _STAGES_LIST])
+_STAGE_RECOVERY = np.array(
+    [STAGE_THRESHOLDS[s].get("avg_recovery_time", np.inf)
+     for s in _STAGES_LIST])
+_STAGE_OSC = np.array(
+    [STAGE_THRESHOLDS[s].get("max_oscillation",
+                             STAGE_THRESHOLDS[s].get("oscillation_count",
+                                                     np.inf))
+     for s in _STAGES_LIST])
+_STAGE_RESTLESS = np.array(
+    [STAGE_THRESHOLDS[s].get("restless_episodes", np.inf)
+     for s in _STAGES_LIST])
+
 
 class MeditationEngine:
     """
@@ -214,35 +494,24 @@ class MeditationEngine:
     def __init__(
         self,
         seed_bank: Optional[Dict[str, float]] = None,
-        particular: Optional[Dict[str, float]] = None
+        particular: Optional[Dict[str, float]] = None,
+        rng_seed: Optional[int] = None,
+        enable_log: bool = True,
     ):
-        # 种子库（潜伏层）
-        self.seeds = seed_bank or {
-            "sloth_torpor": 0.5,
-            "restlessness": 0.5,
-            "sensual_desire": 0.5,
-            "ill_will": 0.5,
-            "doubt": 0.5,
-            # 善种子
-            "mindfulness": 0.5,
-            "concentration": 0.5,
-            "diligence": 0.5,
-            "tranquility": 0.5,
-            "equanimity": 0.5,
-        }
-        
-        # 别境五（能力条）
-        self.particular = particular or {
-            "chanda": 0.5,      # 欲
-            "adhimoksa": 0.5,   # 胜解
-            "smrti": 0.5,       # 念
-            "samadhi": 0.5,     # 定
-            "prajna": 0.5,      # 慧
-        }
-        
+        # 种子库（潜伏层）：定长数组，按 _SEED_ORDER 索引
+        seed_bank = seed_bank or {}
+        self.seeds = np.array(
+            [seed_bank.get(k, 0.5) for k in _SEED_ORDER], dtype=np.float32)
+
+        # 别境五（能力条）：按 _PARTICULAR_ORDER 索引
+        particular = particular or {}
+        self.particular = np.array(
+            [particular.get(k, 0.5) for k in _PARTICULAR_ORDER],
+            dtype=np.float32)
+
         # 当前状态
         self.state = MeditationState()
-        
+
         # 本局统计
         self.stats = SessionStats()
         
@@ -250,56 +519,99 @@ class MeditationEngine:
         self.elapsed_seconds = 0
         self.session_duration = 600  # 默认10分钟
         
-        # 事件日志
-        self.event_log: List[str] = []
-        
+        # 事件日志：环形缓冲，存 (秒数, 消息) 元组，end_session 时才格式化
+        self.log_enabled = enable_log
+        self.event_log: Deque[Tuple[int, str]] = deque(maxlen=4096)
+        if not enable_log:
+            # 直接把 _log 换成无操作绑定，连标志检查都省掉
+            self._log = self._log_noop
+
+        # 随机数：每局在 start_session 预生成 (T+16, 8) 均匀数池，
+        # 按 (秒, 槽位) 索引，替代每秒 6+ 次 random.random() 调用
+        self._rng = np.random.default_rng(rng_seed)
+        self._rand_pool = self._rng.random((16, _N_RAND_SLOTS),
+                                           dtype=np.float32)
+
         # 内部状态
         self._last_on_object = True
         self._wander_start_time = 0
         self._last_state_change = 0
-    
+
+        # 基础稳定度/明晰度缓存：只在种子/别境变化后才重算
+        self._base_stability = self._calculate_base_stability()
+        self._base_clarity = self._calculate_base_clarity()
+        self._base_dirty = False
+
+        # 无 numba 时在 start_session 生成 exec 专用核心
+        self._tick_fn: Optional[Callable] = None
+
     def start_session(self, duration_minutes: int = 10):
         """开始一局禅修"""
         self.session_duration = duration_minutes * 60
         self.elapsed_seconds = 0
         self.state = MeditationState()
         self.stats = SessionStats(duration_seconds=self.session_duration)
-        self.event_log = []
+        self.event_log.clear()
         self._last_on_object = True
         self._wander_start_time = 0
-        
+        self._rand_pool = self._rng.random(
+            (self.session_duration + 16, _N_RAND_SLOTS), dtype=np.float32)
+
+        # 纯 Python 路径：为本局生成常量内联的专用核心
+        # （有 numba 时 jit 核心更快，不走这条路）
+        if not _HAVE_NUMBA:
+            self._tick_fn = _build_tick_spec(
+                self.session_duration, self.particular[IDX_SMRTI])
+
         # 根据种子设置初始状态
-        self.state.stability = self._calculate_base_stability()
-        self.state.clarity = self._calculate_base_clarity()
+        self._refresh_base()
+        self.state.stability = self._base_stability
+        self.state.clarity = self._base_clarity
         
         self._log("禅修开始")
     
+    @property
+    def active_hindrance_ids(self) -> List[str]:
+        """当前激活盖的 id 列表（按 _HINDRANCE_ORDER）"""
+        strengths = self.state.active_hindrances
+        return [_HINDRANCE_ORDER[i] for i in range(5) if strengths[i] > 0.0]
+
+    @property
+    def seeds_dict(self) -> Dict[str, float]:
+        """种子库的 dict 视图（只读快照，供外部展示用）"""
+        return {k: float(v) for k, v in zip(_SEED_ORDER, self.seeds)}
+
+    @property
+    def particular_dict(self) -> Dict[str, float]:
+        """别境五的 dict 视图（只读快照，供外部展示用）"""
+        return {k: float(v) for k, v in zip(_PARTICULAR_ORDER, self.particular)}
+
     def _calculate_base_stability(self) -> float:
         """计算基础稳定度"""
-        samadhi = self.particular.get("samadhi", 0.5)
-        smrti = self.particular.get("smrti", 0.5)
-        adhimoksa = self.particular.get("adhimoksa", 0.5)
-        
+        samadhi = self.particular[IDX_SAMADHI]
+        smrti = self.particular[IDX_SMRTI]
+        adhimoksa = self.particular[IDX_ADHIMOKSA]
+
         # 减去惛沉和掉举的潜伏影响
-        restless_seed = self.seeds.get("restlessness", 0.5)
-        
+        restless_seed = self.seeds[IDX_RESTLESSNESS]
+
         base = (samadhi * 0.4 + smrti * 0.3 + adhimoksa * 0.2 + 0.1)
         base -= restless_seed * 0.2
-        
-        return max(0.1, min(0.9, base))
-    
+
+        return max(0.1, min(0.9, float(base)))
+
     def _calculate_base_clarity(self) -> float:
         """计算基础明晰度"""
-        samadhi = self.particular.get("samadhi", 0.5)
-        prajna = self.particular.get("prajna", 0.5)
-        
+        samadhi = self.particular[IDX_SAMADHI]
+        prajna = self.particular[IDX_PRAJNA]
+
         # 减去惛沉的潜伏影响
-        sloth_seed = self.seeds.get("sloth_torpor", 0.5)
-        
+        sloth_seed = self.seeds[IDX_SLOTH_TORPOR]
+
         base = (samadhi * 0.3 + prajna * 0.4 + 0.3)
         base -= sloth_seed * 0.3
-        
-        return max(0.1, min(0.9, base))
+
+        return max(0.1, min(0.9, float(base)))
     
     def tick(self) -> Dict:
         """
@@ -308,108 +620,142 @@ class MeditationEngine:
         Returns:
             当前状态和事件
         """
-        self.elapsed_seconds += 1
-        events = []
-        
-        # 1. 计算盖的压力
-        hindrance_pressure = self._calculate_hindrance_pressure()
-        
-        # 2. 更新稳定度和明晰度
-        self._update_stability_clarity(hindrance_pressure)
-        
-        # 3. 检查是否触发走神/惛沉/掉举
-        events.extend(self._check_state_changes())
-        
-        # 4. 更新统计
-        self._update_stats()
-        
+        elapsed = self.elapsed_seconds + 1
+        self.elapsed_seconds = elapsed
+
+        # 1. 数值更新：盖的压力/激活 + 稳定度/明晰度（单趟融合核心）
+        self._tick_numeric()
+
+        # 2. 检查是否触发走神/惛沉/掉举
+        events = self._check_state_changes()
+
+        # 3. 更新统计（原 _update_stats，内联并绑定局部变量，
+        #    省掉每秒一次的方法调用和 self.state.X 链式取值）
+        state = self.state
+        stats = self.stats
+        if state.on_object:
+            stats.on_object_time += 1
+        else:
+            state.wandering_duration = elapsed - self._wander_start_time
+        if state.clarity > 0.5:
+            stats.clarity_time += 1
+
         return {
-            "elapsed": self.elapsed_seconds,
-            "stability": self.state.stability,
-            "clarity": self.state.clarity,
-            "on_object": self.state.on_object,
-            "is_dull": self.state.is_dull,
-            "is_restless": self.state.is_restless,
+            "elapsed": elapsed,
+            "stability": state.stability,
+            "clarity": state.clarity,
+            "on_object": state.on_object,
+            "is_dull": state.is_dull,
+            "is_restless": state.is_restless,
+            "wandering_duration": state.wandering_duration,
             "events": events,
-            "active_hindrances": list(self.state.active_hindrances.keys()),
+            "active_hindrances": self.active_hindrance_ids,
         }
     
-    def _calculate_hindrance_pressure(self) -> Dict[str, float]:
-        """计算各盖的当前压力"""
-        pressure = {}
-        
-        for hid, hindrance in FIVE_HINDRANCES.items():
-            # 基础压力来自种子
-            base = self.seeds.get(hid, 0.5)
-            
-            # 随时间可能累积（疲劳等）
-            fatigue_factor = min(1.0, self.elapsed_seconds / self.session_duration)
-            
-            # 惛沉随时间增加
-            if hid == "sloth_torpor":
-                base += fatigue_factor * 0.2
-            
-            # 掉举在开始时较高
-            if hid == "restlessness":
-                base += (1 - fatigue_factor) * 0.1
-            
-            # 念可以压制
-            smrti = self.particular.get("smrti", 0.5)
-            base -= smrti * 0.2
-            
-            pressure[hid] = max(0.0, min(1.0, base))
-            
-            # 超过阈值则激活
-            if base > 0.6 and random.random() < base * 0.1:
-                if hid not in self.state.active_hindrances:
-                    self.state.active_hindrances[hid] = base
-                    self.stats.hindrance_activations[hid] = \
-                        self.stats.hindrance_activations.get(hid, 0) + 1
-                    self._log(f"{hindrance.name}现起")
-        
-        return pressure
-    
-    def _update_stability_clarity(self, pressure: Dict[str, float]):
-        """更新稳定度和明晰度"""
-        # 基础恢复
-        base_stability = self._calculate_base_stability()
-        base_clarity = self._calculate_base_clarity()
-        
-        # 向基础值缓慢回归
-        self.state.stability += (base_stability - self.state.stability) * 0.05
-        self.state.clarity += (base_clarity - self.state.clarity) * 0.05
-        
-        # 盖的损害
-        for hid, strength in self.state.active_hindrances.items():
-            hindrance = FIVE_HINDRANCES[hid]
-            self.state.stability -= hindrance.stability_damage * strength * 0.1
-            self.state.clarity -= hindrance.clarity_damage * strength * 0.1
-        
-        # 掉举压力直接损害稳定
-        restless_p = pressure.get("restlessness", 0)
-        self.state.stability -= restless_p * 0.05
-        
-        # 惛沉压力直接损害明晰
-        sloth_p = pressure.get("sloth_torpor", 0)
-        self.state.clarity -= sloth_p * 0.05
-        
-        # 限制范围
-        self.state.stability = max(0.1, min(0.95, self.state.stability))
-        self.state.clarity = max(0.1, min(0.95, self.state.clarity))
+    def _refresh_base(self):
+        """重算基础稳定度/明晰度缓存"""
+        self._base_stability = self._calculate_base_stability()
+        self._base_clarity = self._calculate_base_clarity()
+        self._base_dirty = False
+
+    def run_autonomous(
+        self,
+        policy: Optional[Callable[[Dict], Tuple[bool, Optional[str]]]] = None,
+        duration_s: Optional[int] = None,
+        snapshot_every: int = 60,
+    ) -> List[Dict]:
+        """
+        整局自动推进（把逐秒循环收进引擎内部，省掉外部调度开销）
+
+        Args:
+            policy: 每秒回调，收 tick 结果，返回 (是否觉知归返, 调整动作或 None)
+            duration_s: 推进秒数，默认走完本局剩余时长
+            snapshot_every: 每隔多少秒留一个状态快照（0 表示不留）
+
+        Returns:
+            状态快照列表
+        """
+        if duration_s is None:
+            duration_s = self.session_duration - self.elapsed_seconds
+
+        snapshots: List[Dict] = []
+        tick = self.tick
+        for _ in range(duration_s):
+            result = tick()
+
+            if policy is not None:
+                should_notice, adjust = policy(result)
+                if should_notice and not result["on_object"]:
+                    self.player_notice()
+                    self.player_return()
+                if adjust:
+                    self.player_adjust(adjust)
+
+            if snapshot_every and result["elapsed"] % snapshot_every == 0:
+                snapshots.append(result)
+
+        return snapshots
+
+    def _tick_numeric(self):
+        """每秒数值更新：压力/激活/稳定度/明晰度，一次融合核心调用"""
+        if self._base_dirty:
+            self._refresh_base()
+
+        rand5 = self._rand_row()[HINDRANCE_SLOT0:HINDRANCE_SLOT0 + 5]
+
+        if self._tick_fn is not None:
+            # exec 生成的专用核心（常量已内联，t 在函数内折算疲劳）
+            self.state.stability, self.state.clarity, activated = \
+                self._tick_fn(
+                    self.seeds,
+                    self.state.active_hindrances,
+                    self.state.stability, self.state.clarity,
+                    self._base_stability, self._base_clarity,
+                    self.elapsed_seconds, rand5,
+                )
+        else:
+            fatigue_factor = min(
+                1.0, self.elapsed_seconds / self.session_duration)
+            self.state.stability, self.state.clarity, activated = \
+                _tick_numeric_core(
+                    self.seeds,
+                    self.particular[IDX_SMRTI],
+                    fatigue_factor,
+                    rand5,
+                    self.state.active_hindrances,
+                    self.state.stability, self.state.clarity,
+                    self._base_stability, self._base_clarity,
+                    _STAB_DMG, _CLAR_DMG,
+                )
+
+        # 新激活的盖只剩统计与日志需要回写 Python 侧
+        for i in range(5):
+            if activated[i]:
+                hid = _HINDRANCE_ORDER[i]
+                self.stats.hindrance_activations[hid] = \
+                    self.stats.hindrance_activations.get(hid, 0) + 1
+                self._log(f"{_HINDRANCE_NAMES[i]}现起")
+
+    def _rand_row(self) -> np.ndarray:
+        """当前秒的均匀随机数行；tick 越过池长时成倍扩池（罕见路径）"""
+        if self.elapsed_seconds >= self._rand_pool.shape[0]:
+            extra = self._rng.random(self._rand_pool.shape, dtype=np.float32)
+            self._rand_pool = np.concatenate([self._rand_pool, extra])
+        return self._rand_pool[self.elapsed_seconds]
     
     def _check_state_changes(self) -> List[str]:
         """检查状态变化（走神、惛沉、掉举）"""
         events = []
         
-        # 走神概率
+        # 走神概率（每秒5%基础概率）
         if self.state.on_object:
-            wander_prob = self._sigmoid(
-                -self.state.stability * 2 + 
-                self.seeds.get("restlessness", 0.5) - 
-                self.particular.get("smrti", 0.5)
-            ) * 0.05  # 每秒5%基础概率
-            
-            if random.random() < wander_prob:
+            wander_prob = _wander_prob_core(
+                self.state.stability,
+                self.seeds[IDX_RESTLESSNESS],
+                self.particular[IDX_SMRTI],
+            )
+
+            if self._rand_row()[WANDER_SLOT] < wander_prob:
                 self.state.on_object = False
                 self.state.is_wandering = True
                 self._wander_start_time = self.elapsed_seconds
@@ -441,19 +787,6 @@ class MeditationEngine:
         
         return events
     
-    def _update_stats(self):
-        """更新统计"""
-        if self.state.on_object:
-            self.stats.on_object_time += 1
-        
-        if self.state.clarity > 0.5:
-            self.stats.clarity_time += 1
-        
-        # 走神持续时间
-        if not self.state.on_object:
-            self.state.wandering_duration = \
-                self.elapsed_seconds - self._wander_start_time
-    
     def player_notice(self) -> Dict:
         """
         玩家觉知（按下"归返"按钮）
@@ -474,7 +807,8 @@ class MeditationEngine:
             result["noticed"] = True
             
             self.state.noticing_latency = latency
-            self.stats.noticing_latencies.append(latency)
+            self.stats.noticing_latency_sum += latency
+            self.stats.noticing_latency_count += 1
             
             self._log(f"觉知（延迟{latency:.1f}秒）")
             
@@ -493,8 +827,7 @@ class MeditationEngine:
             
             # 应用种子变化
             for seed_id, delta in result["seed_changes"].items():
-                self.seeds[seed_id] = max(0, min(1, 
-                    self.seeds.get(seed_id, 0.5) + delta))
+                self._bump_seed(seed_id, delta)
         
         return result
     
@@ -515,7 +848,8 @@ class MeditationEngine:
             result["recovery_time"] = recovery_time
             result["returned"] = True
             
-            self.stats.recovery_times.append(recovery_time)
+            self.stats.recovery_time_sum += recovery_time
+            self.stats.recovery_time_count += 1
             self.stats.return_count += 1
             
             # 回到所缘
@@ -527,11 +861,17 @@ class MeditationEngine:
             self.state.stability += 0.05
             
             self._log(f"归返（用时{recovery_time:.1f}秒）")
-            
+
             # 清除激活的盖
-            self.state.active_hindrances.clear()
-        
+            self.state.active_hindrances.fill(0.0)
+
         return result
+
+    def _bump_seed(self, seed_id: str, delta: float):
+        """按增量写种子（熏习），裁剪到 [0, 1]"""
+        idx = _SEED_INDEX[seed_id]
+        self.seeds[idx] = max(0.0, min(1.0, float(self.seeds[idx]) + delta))
+        self._base_dirty = True
     
     def player_adjust(self, action: str) -> Dict:
         """
@@ -555,8 +895,7 @@ class MeditationEngine:
                 # 如果过度提起
                 if self.state.stability < 0.4:
                     result["effect"] += "，但稳定度下降"
-                    self.seeds["restlessness"] = min(1, 
-                        self.seeds.get("restlessness", 0.5) + 0.01)
+                    self._bump_seed("restlessness", 0.01)
             else:
                 result["effect"] = "当前不需要提起"
                 
@@ -570,8 +909,7 @@ class MeditationEngine:
                 # 如果过度放松
                 if self.state.clarity < 0.4:
                     result["effect"] += "，但明晰度下降"
-                    self.seeds["sloth_torpor"] = min(1,
-                        self.seeds.get("sloth_torpor", 0.5) + 0.01)
+                    self._bump_seed("sloth_torpor", 0.01)
             else:
                 result["effect"] = "当前不需要放松"
         
@@ -587,13 +925,13 @@ class MeditationEngine:
         self.stats.clarity_ratio = self.stats.clarity_time / total
         
         # 计算平均值
-        if self.stats.noticing_latencies:
+        if self.stats.noticing_latency_count:
             self.stats.avg_noticing_latency = \
-                sum(self.stats.noticing_latencies) / len(self.stats.noticing_latencies)
-        
-        if self.stats.recovery_times:
+                self.stats.noticing_latency_sum / self.stats.noticing_latency_count
+
+        if self.stats.recovery_time_count:
             self.stats.avg_recovery_time = \
-                sum(self.stats.recovery_times) / len(self.stats.recovery_times)
+                self.stats.recovery_time_sum / self.stats.recovery_time_count
         
         # 判定段位
         stage = self._determine_stage()
@@ -603,58 +941,35 @@ class MeditationEngine:
         
         self._log("禅修结束")
         
+        full_stats = self.stats._asdict_fast()
+        stats = {"duration": self.elapsed_seconds}
+        stats.update((k, full_stats[k]) for k in _PUBLIC_STAT_KEYS)
+
         return {
-            "stats": {
-                "duration": self.elapsed_seconds,
-                "on_object_ratio": self.stats.on_object_ratio,
-                "clarity_ratio": self.stats.clarity_ratio,
-                "avg_noticing_latency": self.stats.avg_noticing_latency,
-                "avg_recovery_time": self.stats.avg_recovery_time,
-                "oscillation_count": self.stats.oscillation_count,
-                "wander_count": self.stats.wander_count,
-                "return_count": self.stats.return_count,
-                "dull_episodes": self.stats.dull_episodes,
-                "restless_episodes": self.stats.restless_episodes,
-            },
-            "stage": stage.value if stage else "未达标",
+            "stats": stats,
+            "stage": stage.label if stage is not None else "未达标",
             "review": review,
-            "event_log": self.event_log,
+            "event_log": [f"[{t}s] {m}" for t, m in self.event_log],
         }
     
     def _determine_stage(self) -> Optional[NineStages]:
-        """判定达到的最高段位"""
-        achieved = None
-        
-        for stage in NineStages:
-            thresholds = STAGE_THRESHOLDS.get(stage, {})
-            passed = True
-            
-            for key, threshold in thresholds.items():
-                if key == "on_object_ratio":
-                    if self.stats.on_object_ratio < threshold:
-                        passed = False
-                elif key == "clarity_ratio":
-                    if self.stats.clarity_ratio < threshold:
-                        passed = False
-                elif key == "avg_noticing_latency":
-                    if self.stats.avg_noticing_latency > threshold:
-                        passed = False
-                elif key == "avg_recovery_time":
-                    if self.stats.avg_recovery_time > threshold:
-                        passed = False
-                elif key == "max_oscillation" or key == "oscillation_count":
-                    if self.stats.oscillation_count > threshold:
-                        passed = False
-                elif key == "restless_episodes":
-                    if self.stats.restless_episodes > threshold:
-                        passed = False
-            
-            if passed:
-                achieved = stage
-            else:
-                break  # 段位是递进的
-        
-        return achieved
+        """判定达到的最高段位（一次向量比较，段位是递进的）"""
+        stats = self.stats
+        passed = ((stats.on_object_ratio >= _STAGE_ON_OBJECT) &
+                  (stats.clarity_ratio >= _STAGE_CLARITY) &
+                  (stats.avg_noticing_latency <= _STAGE_LATENCY) &
+                  (stats.avg_recovery_time <= _STAGE_RECOVERY) &
+                  (stats.oscillation_count <= _STAGE_OSC) &
+                  (stats.restless_episodes <= _STAGE_RESTLESS))
+
+        if passed.all():
+            return _STAGES_LIST[-1]
+
+        # 第一个未达标段位之前的连续段位即为成就
+        highest = int(np.argmin(passed)) - 1
+        if highest < 0:
+            return None
+        return _STAGES_LIST[highest]
     
     def _generate_review(self, stage: Optional[NineStages]) -> str:
         """生成复盘文字"""
@@ -702,18 +1017,18 @@ class MeditationEngine:
         
         lines.append("")
         
-        # 段位
-        if stage:
-            lines.append(f"【段位】{stage.value}")
+        # 段位（IntEnum 的内住是 0，不能做真值判断）
+        if stage is not None:
+            lines.append(f"【段位】{stage.label}")
         else:
             lines.append("【段位】继续努力")
         
         return "\n".join(lines)
     
     def _log(self, msg: str):
-        """记录事件"""
-        self.event_log.append(f"[{self.elapsed_seconds}s] {msg}")
-    
-    @staticmethod
-    def _sigmoid(x: float) -> float:
-        return 1.0 / (1.0 + math.exp(-x))
+        """记录事件（延迟格式化，静音时直接跳过）"""
+        if self.log_enabled:
+            self.event_log.append((self.elapsed_seconds, msg))
+
+    def _log_noop(self, msg: str):
+        """enable_log=False 时顶替 _log 的无操作实现"""
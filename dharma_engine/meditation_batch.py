@@ -0,0 +1,265 @@
+"""
+批量禅修模拟 (Batched Meditation Monte Carlo)
+
+面向参数扫描与训练效果研究的向量化引擎：
+- N 个修行者的状态保存在 (N,) 数组中，并行推进
+- 只有时间维 T 保持顺序循环（逐秒状态有依赖），
+  每一步内对 N 个修行者 × 5 盖做 NumPy 广播更新
+- 与 MeditationEngine.tick() 的逐秒动力学一致，
+  但消除了每秒一次的 Python 调度开销
+
+用法：
+    rng = np.random.default_rng(42)
+    result = simulate_batch(seeds, particular, T=600, rng=rng)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from typing import Dict, List, Optional
+
+from .meditation import FIVE_HINDRANCES, MeditationEngine
+
+
+# 五盖的固定顺序（与 FIVE_HINDRANCES 一致）
+HINDRANCE_ORDER = tuple(FIVE_HINDRANCES.keys())
+
+# 盖对稳定度/明晰度的损害（SoA 常量数组）
+STAB_DMG = np.array(
+    [h.stability_damage for h in FIVE_HINDRANCES.values()], dtype=np.float32)
+CLAR_DMG = np.array(
+    [h.clarity_damage for h in FIVE_HINDRANCES.values()], dtype=np.float32)
+
+# 种子列索引（seeds 矩阵的列）
+H_SENSUAL = 0
+H_ILL_WILL = 1
+H_SLOTH = 2
+H_RESTLESS = 3
+H_DOUBT = 4
+
+# 别境五索引（particular 矩阵的列）
+P_CHANDA = 0
+P_ADHIMOKSA = 1
+P_SMRTI = 2
+P_SAMADHI = 3
+P_PRAJNA = 4
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def _base_stability(seeds: np.ndarray, particular: np.ndarray) -> np.ndarray:
+    """基础稳定度（与 MeditationEngine._calculate_base_stability 一致）"""
+    base = (particular[:, P_SAMADHI] * 0.4 +
+            particular[:, P_SMRTI] * 0.3 +
+            particular[:, P_ADHIMOKSA] * 0.2 + 0.1)
+    base -= seeds[:, H_RESTLESS] * 0.2
+    return np.clip(base, 0.1, 0.9)
+
+
+def _base_clarity(seeds: np.ndarray, particular: np.ndarray) -> np.ndarray:
+    """基础明晰度（与 MeditationEngine._calculate_base_clarity 一致）"""
+    base = (particular[:, P_SAMADHI] * 0.3 +
+            particular[:, P_PRAJNA] * 0.4 + 0.3)
+    base -= seeds[:, H_SLOTH] * 0.3
+    return np.clip(base, 0.1, 0.9)
+
+
+def simulate_batch(
+    seeds: np.ndarray,
+    particular: np.ndarray,
+    T: int = 600,
+    rng: Optional[np.random.Generator] = None,
+    notice_delay: int = 5,
+    log_sample: int = 0,
+) -> Dict:
+    """
+    并行模拟 N 个修行者各禅修 T 秒
+
+    Args:
+        seeds: (N, 5) 五盖种子强度，列序为 HINDRANCE_ORDER
+        particular: (N, 5) 别境五能力，列序为 欲/胜解/念/定/慧
+        T: 每局时长（秒）
+        rng: NumPy 随机数生成器（传入可复现）
+        notice_delay: 走神多少秒后自动觉知归返（模拟玩家）
+        log_sample: 只为前 log_sample 个修行者记录事件日志
+
+    Returns:
+        统计字典，各项均为 (N,) 或 (N, 5) 数组
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    seeds = np.asarray(seeds, dtype=np.float32)
+    particular = np.asarray(particular, dtype=np.float32)
+    N = seeds.shape[0]
+
+    # 状态数组
+    base_stab = _base_stability(seeds, particular)
+    base_clar = _base_clarity(seeds, particular)
+    stability = base_stab.copy()
+    clarity = base_clar.copy()
+    on_object = np.ones(N, dtype=np.bool_)
+    wandering = np.zeros(N, dtype=np.int32)       # 走神持续秒数
+    strengths = np.zeros((N, 5), dtype=np.float32)  # 激活盖的强度（0=未激活）
+
+    # 统计累加器
+    on_object_time = np.zeros(N, dtype=np.float32)
+    clarity_time = np.zeros(N, dtype=np.float32)
+    wander_count = np.zeros(N, dtype=np.int32)
+    return_count = np.zeros(N, dtype=np.int32)
+    recovery_sum = np.zeros(N, dtype=np.float32)
+    dull_episodes = np.zeros(N, dtype=np.int32)
+    restless_episodes = np.zeros(N, dtype=np.int32)
+    hindrance_activations = np.zeros((N, 5), dtype=np.int32)
+
+    was_dull = np.zeros(N, dtype=np.bool_)
+    was_restless = np.zeros(N, dtype=np.bool_)
+
+    event_log: List[str] = []
+
+    smrti = particular[:, P_SMRTI:P_SMRTI + 1]  # (N, 1) 广播到 5 盖
+
+    for t in range(1, T + 1):
+        fatigue = min(1.0, t / T)
+
+        # 1. 五盖压力：种子 + 疲劳调整 - 念的压制（(N, 5) 广播）
+        pressure = seeds - smrti * 0.2
+        pressure[:, H_SLOTH] += fatigue * 0.2
+        pressure[:, H_RESTLESS] += (1.0 - fatigue) * 0.1
+        pressure = np.clip(pressure, 0.0, 1.0)
+
+        # 2. 盖的激活（压力超阈值时按概率现起）
+        activate = ((pressure > 0.6) &
+                    (rng.random((N, 5)) < pressure * 0.1) &
+                    (strengths == 0.0))
+        strengths = np.where(activate, pressure, strengths)
+        hindrance_activations += activate
+
+        # 3. 更新稳定度/明晰度：向基础值回归 + 盖的损害 + 压力直接损害
+        stability += (base_stab - stability) * 0.05
+        clarity += (base_clar - clarity) * 0.05
+        stability -= (strengths * STAB_DMG).sum(axis=1) * 0.1
+        clarity -= (strengths * CLAR_DMG).sum(axis=1) * 0.1
+        stability -= pressure[:, H_RESTLESS] * 0.05
+        clarity -= pressure[:, H_SLOTH] * 0.05
+        np.clip(stability, 0.1, 0.95, out=stability)
+        np.clip(clarity, 0.1, 0.95, out=clarity)
+
+        # 4. 走神判定
+        wander_prob = _sigmoid(
+            -stability * 2 + seeds[:, H_RESTLESS] - particular[:, P_SMRTI]
+        ) * 0.05
+        wander = on_object & (rng.random(N) < wander_prob)
+        on_object &= ~wander
+        wander_count += wander
+        wandering = np.where(on_object, 0, wandering + 1)
+
+        # 5. 自动觉知归返（模拟玩家在 notice_delay 秒后归返）
+        returning = (~on_object) & (wandering >= notice_delay)
+        recovery_sum += np.where(returning, wandering, 0).astype(np.float32)
+        return_count += returning
+        on_object |= returning
+        stability += returning * np.float32(0.05)
+        wandering = np.where(returning, 0, wandering)
+        strengths = np.where(returning[:, None], 0.0, strengths)
+
+        # 6. 惛沉/掉举发作计数
+        is_dull = clarity < 0.4
+        is_restless = stability < 0.4
+        dull_episodes += is_dull & ~was_dull
+        restless_episodes += is_restless & ~was_restless
+        was_dull = is_dull
+        was_restless = is_restless
+
+        # 7. 统计
+        on_object_time += on_object
+        clarity_time += clarity > 0.5
+
+        # 事件日志只记录抽样子集
+        if log_sample:
+            for i in np.nonzero(wander[:log_sample])[0]:
+                event_log.append(f"[{t}s] 修行者{i}: 心离所缘")
+            for i in np.nonzero(returning[:log_sample])[0]:
+                event_log.append(f"[{t}s] 修行者{i}: 归返")
+
+    avg_recovery = np.where(
+        return_count > 0, recovery_sum / np.maximum(return_count, 1), 0.0)
+
+    return {
+        "on_object_ratio": on_object_time / T,
+        "clarity_ratio": clarity_time / T,
+        "wander_count": wander_count,
+        "return_count": return_count,
+        "avg_recovery_time": avg_recovery,
+        "dull_episodes": dull_episodes,
+        "restless_episodes": restless_episodes,
+        "hindrance_activations": hindrance_activations,
+        "final_stability": stability,
+        "final_clarity": clarity,
+        "event_log": event_log,
+    }
+
+
+def _run_one(config: Dict) -> Dict:
+    """进程池 worker：按配置跑完一局，返回 end_session 结果（模块级才可被 pickle）"""
+    engine = MeditationEngine(
+        seed_bank=config.get("seed_bank"),
+        particular=config.get("particular"),
+        rng_seed=config.get("rng_seed"),
+        enable_log=False,
+    )
+    engine.start_session(duration_minutes=config.get("duration_minutes", 3))
+
+    delay = config.get("notice_delay", 5)
+    adjust_dull = config.get("adjust_dull", False)
+    adjust_restless = config.get("adjust_restless", False)
+
+    def policy(result):
+        adjust = None
+        if adjust_dull and result["is_dull"]:
+            adjust = "raise"
+        elif adjust_restless and result["is_restless"]:
+            adjust = "relax"
+        return result["wandering_duration"] > delay, adjust
+
+    engine.run_autonomous(policy)
+    out = engine.end_session()
+    out["seeds"] = engine.seeds_dict  # 熏习后的种子，供参数扫描接续使用
+    return out
+
+
+def simulate_many(
+    configs: List[Dict],
+    max_workers: Optional[int] = None,
+) -> List[Dict]:
+    """
+    并行跑多局相互独立的禅修（每局一个配置字典）
+
+    配置键：seed_bank / particular / rng_seed / duration_minutes /
+    notice_delay / adjust_dull / adjust_restless，
+    语义与 MeditationEngine 及 run_autonomous 的策略回调一致。
+
+    各局之间无状态依赖，用 ProcessPoolExecutor 摊到多核；
+    单局或单核机器直接顺序执行，省掉起进程池的开销。
+    返回顺序与 configs 一致。
+    """
+    if len(configs) <= 1 or (os.cpu_count() or 1) == 1:
+        return [_run_one(c) for c in configs]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_run_one, configs))
+
+
+def seeds_from_dict(seed_bank: Dict[str, float], n: int = 1) -> np.ndarray:
+    """把 MeditationEngine 风格的种子字典展开成 (n, 5) 矩阵"""
+    row = [seed_bank.get(k, 0.5) for k in HINDRANCE_ORDER]
+    return np.tile(np.array(row, dtype=np.float32), (n, 1))
+
+
+def particular_from_dict(particular: Dict[str, float], n: int = 1) -> np.ndarray:
+    """把别境五字典展开成 (n, 5) 矩阵"""
+    row = [particular.get(k, 0.5)
+           for k in ("chanda", "adhimoksa", "smrti", "samadhi", "prajna")]
+    return np.tile(np.array(row, dtype=np.float32), (n, 1))
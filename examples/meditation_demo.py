@@ -19,6 +19,7 @@ from dharma_engine.meditation import (
     NineStages,
     STAGE_THRESHOLDS
 )
+from dharma_engine.meditation_batch import simulate_many
 
 
 def print_separator(title: str = ""):
@@ -39,49 +40,36 @@ def demo_basic_session():
     print(f"  稳定度: {engine.state.stability:.2f}")
     print(f"  明晰度: {engine.state.clarity:.2f}")
     
-    # 模拟禅修过程
+    # 模拟禅修过程：逐秒循环交给引擎，这里只给策略回调
     print("\n开始禅修...")
-    
-    for second in range(300):  # 5分钟
-        result = engine.tick()
-        
-        # 显示关键事件
-        for event in result["events"]:
-            print(f"  [{second}s] {event}")
-        
-        # 模拟玩家在走神时的觉知
-        if not result["on_object"]:
-            # 觉知延迟：根据念的强度
-            notice_delay = random.randint(2, 8)
-            if engine.state.wandering_duration >= notice_delay:
-                notice_result = engine.player_notice()
-                if notice_result["noticed"]:
-                    print(f"  [{second}s] 觉知! (延迟{notice_result['latency']:.1f}s)")
-                    
-                    # 归返
-                    engine.player_return()
-                    print(f"  [{second}s] 归返所缘")
-        
-        # 模拟玩家调整
-        if engine.state.is_dull and random.random() < 0.3:
-            engine.player_adjust("raise")
-            print(f"  [{second}s] 提起（对治惛沉）")
-        
-        if engine.state.is_restless and random.random() < 0.3:
-            engine.player_adjust("relax")
-            print(f"  [{second}s] 放松（对治掉举）")
-        
-        # 每分钟显示状态
-        if (second + 1) % 60 == 0:
-            print(f"\n  --- 第{(second+1)//60}分钟 ---")
-            print(f"  稳定度: {engine.state.stability:.2f}")
-            print(f"  明晰度: {engine.state.clarity:.2f}")
-    
+
+    def player_policy(result):
+        # 觉知延迟：根据念的强度；惛沉/掉举时以 30% 概率调整
+        should_notice = (not result["on_object"] and
+                         result["wandering_duration"] >= random.randint(2, 8))
+        adjust = None
+        if result["is_dull"] and random.random() < 0.3:
+            adjust = "raise"
+        elif result["is_restless"] and random.random() < 0.3:
+            adjust = "relax"
+        return should_notice, adjust
+
+    snapshots = engine.run_autonomous(player_policy, duration_s=300)
+
+    for snap in snapshots:
+        print(f"\n  --- 第{snap['elapsed']//60}分钟 ---")
+        print(f"  稳定度: {snap['stability']:.2f}")
+        print(f"  明晰度: {snap['clarity']:.2f}")
+
     # 结束并复盘
     result = engine.end_session()
-    
+
+    print("\n事件日志（节选）:")
+    for line in result["event_log"][:15]:
+        print(f"  {line}")
+
     print("\n" + result["review"])
-    
+
     return engine
 
 
@@ -107,7 +95,7 @@ def demo_nine_stages():
     
     for stage in NineStages:
         thresholds = STAGE_THRESHOLDS.get(stage, {})
-        print(f"【{stage.value}】")
+        print(f"【{stage.label}】")
         for key, val in thresholds.items():
             if "ratio" in key:
                 print(f"  {key}: > {val*100:.0f}%")
@@ -119,64 +107,41 @@ def demo_nine_stages():
 
 
 def demo_different_practitioners():
-    """不同修行者的禅修演示"""
+    """不同修行者的禅修演示（三局互相独立，进程池并行跑）"""
     print_separator("不同修行者对比")
-    
-    # 散乱型
+
+    configs = [
+        {  # 散乱型
+            "seed_bank": {"restlessness": 0.8, "sloth_torpor": 0.3},
+            "particular": {"samadhi": 0.4, "smrti": 0.4},
+            "notice_delay": 5,
+        },
+        {  # 昏沉型（惛沉时提起）
+            "seed_bank": {"restlessness": 0.3, "sloth_torpor": 0.8},
+            "particular": {"samadhi": 0.4, "prajna": 0.3},
+            "notice_delay": 5,
+            "adjust_dull": True,
+        },
+        {  # 熟练修行者
+            "seed_bank": {"restlessness": 0.3, "sloth_torpor": 0.3,
+                          "mindfulness": 0.8},
+            "particular": {"samadhi": 0.7, "smrti": 0.7, "prajna": 0.6},
+            "notice_delay": 2,
+        },
+    ]
+    result1, result2, result3 = simulate_many(configs)
+
     print("\n【散乱型修行者】(掉举种子高)")
-    engine1 = MeditationEngine(
-        seed_bank={"restlessness": 0.8, "sloth_torpor": 0.3},
-        particular={"samadhi": 0.4, "smrti": 0.4}
-    )
-    engine1.start_session(duration_minutes=3)
-    
-    for _ in range(180):
-        result = engine1.tick()
-        if not result["on_object"] and engine1.state.wandering_duration > 5:
-            engine1.player_notice()
-            engine1.player_return()
-    
-    result1 = engine1.end_session()
     print(f"  在所缘比例: {result1['stats']['on_object_ratio']*100:.0f}%")
     print(f"  掉举发作: {result1['stats']['restless_episodes']}次")
     print(f"  段位: {result1['stage']}")
-    
-    # 昏沉型
+
     print("\n【昏沉型修行者】(惛沉种子高)")
-    engine2 = MeditationEngine(
-        seed_bank={"restlessness": 0.3, "sloth_torpor": 0.8},
-        particular={"samadhi": 0.4, "prajna": 0.3}
-    )
-    engine2.start_session(duration_minutes=3)
-    
-    for _ in range(180):
-        result = engine2.tick()
-        if not result["on_object"] and engine2.state.wandering_duration > 5:
-            engine2.player_notice()
-            engine2.player_return()
-        if engine2.state.is_dull:
-            engine2.player_adjust("raise")
-    
-    result2 = engine2.end_session()
     print(f"  在所缘比例: {result2['stats']['on_object_ratio']*100:.0f}%")
     print(f"  惛沉发作: {result2['stats']['dull_episodes']}次")
     print(f"  段位: {result2['stage']}")
-    
-    # 熟练修行者
+
     print("\n【熟练修行者】(念和定都高)")
-    engine3 = MeditationEngine(
-        seed_bank={"restlessness": 0.3, "sloth_torpor": 0.3, "mindfulness": 0.8},
-        particular={"samadhi": 0.7, "smrti": 0.7, "prajna": 0.6}
-    )
-    engine3.start_session(duration_minutes=3)
-    
-    for _ in range(180):
-        result = engine3.tick()
-        if not result["on_object"] and engine3.state.wandering_duration > 2:
-            engine3.player_notice()
-            engine3.player_return()
-    
-    result3 = engine3.end_session()
     print(f"  在所缘比例: {result3['stats']['on_object_ratio']*100:.0f}%")
     print(f"  平均觉知延迟: {result3['stats']['avg_noticing_latency']:.1f}s")
     print(f"  段位: {result3['stage']}")
@@ -194,24 +159,22 @@ def demo_training_effect():
     
     # 模拟7天训练
     for day in range(7):
-        engine = MeditationEngine(seed_bank=seeds.copy(), particular=particular)
+        engine = MeditationEngine(seed_bank=seeds.copy(), particular=particular,
+                                  enable_log=False)
         engine.start_session(duration_minutes=10)
-        
-        for _ in range(600):
-            result = engine.tick()
-            if not result["on_object"]:
-                # 训练觉知越来越快
-                notice_delay = max(2, 8 - day)
-                if engine.state.wandering_duration >= notice_delay:
-                    notice_result = engine.player_notice()
-                    engine.player_return()
-                    
-                    # 累积种子变化
-                    for sid, delta in notice_result.get("seed_changes", {}).items():
-                        if sid in seeds:
-                            seeds[sid] = max(0, min(1, seeds[sid] + delta))
-        
+
+        # 训练觉知越来越快
+        notice_delay = max(2, 8 - day)
+        engine.run_autonomous(
+            lambda r: (r["wandering_duration"] >= notice_delay, None))
+
         result = engine.end_session()
+
+        # 引擎内部已做熏习，带着变化后的种子进入第二天
+        after = engine.seeds_dict
+        for sid in seeds:
+            seeds[sid] = after[sid]
+
         print(f"  第{day+1}天: 段位={result['stage']}, "
               f"散乱种子={seeds['restlessness']:.2f}, "
               f"念种子={seeds['mindfulness']:.2f}")
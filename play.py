@@ -12,92 +12,160 @@
 
 import sys
 import time
-import threading
 import os
 
-# 添加路径
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if os.name != 'nt':
+    import select
+    import termios
+    import tty
+else:
+    import msvcrt
 
 from dharma_engine.meditation import MeditationEngine, NineStages
 
 
+# 进度条缓存：width -> 填充 0..width 格的预拼字符串
+_BAR_CACHE = {}
+
+
 class MeditationGame:
     def __init__(self):
         self.engine = MeditationEngine()
         self.running = False
         self.paused = False
-        
-    def clear_screen(self):
-        os.system('clear' if os.name != 'nt' else 'cls')
+        self._prev_frame = None  # 上一帧的行缓冲，None 表示需要整屏重绘
+        # 每帧不变的横幅/操作栏，构造时拼好
+        self._header = [
+            "=" * 50,
+            "        觉 道 · 禅 修 模 拟",
+            "=" * 50,
+        ]
+        self._footer = [
+            "",
+            "-" * 50,
+            "  [Enter] 归返  [r] 放松  [u] 提起  [q] 结束",
+            "-" * 50,
+        ]
+        # 清屏和按键等待按平台选定一次，绑定成方法，之后调用不再判断 os.name
+        self.clear_screen = (self._clear_posix if os.name != 'nt'
+                             else self._clear_win)
+        self._wait_keys = (self._wait_keys_posix if os.name != 'nt'
+                           else self._wait_keys_win)
+
+    def _clear_posix(self):
+        sys.stdout.write("\x1b[H\x1b[2J")
+        sys.stdout.flush()
+        self._prev_frame = None
+
+    def _clear_win(self):
+        os.system('cls')
+        self._prev_frame = None
     
     def draw_bar(self, value: float, width: int = 20, label: str = "") -> str:
-        """绘制进度条"""
-        filled = int(value * width)
-        bar = "█" * filled + "░" * (width - filled)
-        return f"{label}[{bar}] {value*100:.0f}%"
+        """绘制进度条（条形从缓存取，不逐帧重拼）"""
+        bars = _BAR_CACHE.get(width)
+        if bars is None:
+            bars = _BAR_CACHE[width] = [
+                "█" * i + "░" * (width - i) for i in range(width + 1)]
+        filled = min(width, int(value * width))
+        return f"{label}[{bars[filled]}] {value*100:.0f}%"
     
     def draw_state(self):
-        """绘制当前状态"""
+        """绘制当前状态（只重绘有变化的行）"""
         s = self.engine.state
         elapsed = self.engine.elapsed_seconds
         minutes = elapsed // 60
         seconds = elapsed % 60
-        
-        # 清屏
-        self.clear_screen()
-        
-        print("=" * 50)
-        print("        觉 道 · 禅 修 模 拟")
-        print("=" * 50)
-        print(f"  时间: {minutes:02d}:{seconds:02d}")
-        print()
-        
-        # 双轴显示
-        print(self.draw_bar(s.stability, 25, "稳定 "))
-        print(self.draw_bar(s.clarity, 25, "明晰 "))
-        print()
-        
+
+        frame = self._header + [
+            f"  时间: {minutes:02d}:{seconds:02d}",
+            "",
+            # 双轴显示
+            self.draw_bar(s.stability, 25, "稳定 "),
+            self.draw_bar(s.clarity, 25, "明晰 "),
+            "",
+        ]
+
         # 状态指示
         if s.on_object:
-            print("  🧘 心住所缘")
+            frame.append("  🧘 心住所缘")
         else:
-            print(f"  💭 心已散乱 ({s.wandering_duration:.0f}秒)")
-        
+            frame.append(f"  💭 心已散乱 ({s.wandering_duration:.0f}秒)")
+
         if s.is_dull:
-            print("  😴 惛沉现起 - 按 u 提起")
+            frame.append("  😴 惛沉现起 - 按 u 提起")
         if s.is_restless:
-            print("  😰 掉举现起 - 按 r 放松")
-        
+            frame.append("  😰 掉举现起 - 按 r 放松")
+
         # 激活的盖
-        if s.active_hindrances:
-            hindrances = list(s.active_hindrances.keys())
-            print(f"  ⚠️ 障碍: {', '.join(hindrances)}")
-        
-        print()
-        print("-" * 50)
-        print("  [Enter] 归返  [r] 放松  [u] 提起  [q] 结束")
-        print("-" * 50)
+        hindrances = self.engine.active_hindrance_ids
+        if hindrances:
+            frame.append(f"  ⚠️ 障碍: {', '.join(hindrances)}")
+
+        frame += self._footer
+
+        self._render(frame)
+
+    def _render(self, frame):
+        """差分渲染：首帧整屏输出，之后只用光标定位重写变化的行
+
+        整批输出包在 DEC 同步更新序列（?2026）里，支持的终端会
+        原子地呈现这一帧，避免半帧撕裂。
+        """
+        out = sys.stdout
+        out.write("\x1b[?2026h")
+        prev = self._prev_frame
+        if prev is None:
+            out.write("\x1b[2J\x1b[H")
+            out.write("\n".join(frame))
+        else:
+            for i, line in enumerate(frame):
+                if i >= len(prev) or prev[i] != line:
+                    out.write(f"\x1b[{i + 1};1H\x1b[2K{line}")
+            # 上一帧更长时，清掉多出来的行
+            for i in range(len(frame), len(prev)):
+                out.write(f"\x1b[{i + 1};1H\x1b[2K")
+        out.write("\x1b[?2026l")
+        out.flush()
+        self._prev_frame = frame
     
-    def input_thread(self):
-        """输入处理线程"""
+    def handle_key(self, ch: str):
+        """分发单键输入（cbreak 下逐键到达，无需回车）"""
+        ch = ch.lower()
+        if ch == 'q':
+            self.running = False
+        elif ch == 'r':
+            self.engine.player_adjust("relax")
+            # 效果会在下一帧显示
+        elif ch == 'u':
+            self.engine.player_adjust("raise")
+        elif ch in ('\n', '\r'):
+            # Enter键：归返
+            if not self.engine.state.on_object:
+                self.engine.player_notice()
+                self.engine.player_return()
+
+    def _wait_keys_posix(self, next_t: float):
+        """等到 next_t 截止点，期间 poll stdin，逐键分发"""
         while self.running:
-            try:
-                cmd = input().strip().lower()
-                if cmd == 'q':
-                    self.running = False
-                elif cmd == 'r':
-                    result = self.engine.player_adjust("relax")
-                    # 效果会在下一帧显示
-                elif cmd == 'u':
-                    result = self.engine.player_adjust("raise")
-                elif cmd == '':
-                    # Enter键：归返
-                    if not self.engine.state.on_object:
-                        self.engine.player_notice()
-                        self.engine.player_return()
-            except EOFError:
+            remaining_ms = int((next_t - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
                 break
-    
+            if self._poller.poll(remaining_ms):
+                self.handle_key(
+                    os.read(self._stdin_fd, 1).decode(errors="ignore"))
+
+    def _wait_keys_win(self, next_t: float):
+        """Windows 回退：msvcrt 轮询按键，短睡让出 CPU"""
+        while self.running:
+            remaining = next_t - time.monotonic()
+            if remaining <= 0:
+                break
+            if msvcrt.kbhit():
+                self.handle_key(msvcrt.getwch())
+            else:
+                time.sleep(min(0.05, remaining))
+
     def run(self, duration_minutes: int = 5):
         """运行游戏"""
         self.clear_screen()
@@ -121,25 +189,40 @@ class MeditationGame:
         # 开始禅修
         self.engine.start_session(duration_minutes=duration_minutes)
         self.running = True
-        
-        # 启动输入线程
-        input_handler = threading.Thread(target=self.input_thread, daemon=True)
-        input_handler.start()
-        
-        # 主循环
+
+        # POSIX：终端进入 cbreak，按键立即可读，不必等回车；退出时恢复原设置
+        old_attrs = None
+        if os.name != 'nt':
+            self._stdin_fd = sys.stdin.fileno()
+            old_attrs = termios.tcgetattr(self._stdin_fd)
+            tty.setcbreak(self._stdin_fd)
+            self._poller = select.poll()
+            self._poller.register(self._stdin_fd, select.POLLIN)
+
+        # 主循环：按单调时钟的绝对截止时刻推进，渲染耗时不会累积成漂移
+        next_t = time.monotonic()
         try:
             while self.running and self.engine.elapsed_seconds < self.engine.session_duration:
+                next_t += 1.0
+
                 # 更新状态
                 self.engine.tick()
-                
+
                 # 绘制
                 self.draw_state()
-                
-                # 等待1秒
-                time.sleep(1)
+
+                # 在下一个整秒截止点之前等按键，有输入就立刻处理
+                self._wait_keys(next_t)
+
+                # 落后超过一帧（系统停顿）则重置基准，跳过补帧
+                if next_t < time.monotonic() - 1.0:
+                    next_t = time.monotonic()
         except KeyboardInterrupt:
             pass
-        
+        finally:
+            if old_attrs is not None:
+                termios.tcsetattr(self._stdin_fd, termios.TCSADRAIN, old_attrs)
+
         self.running = False
         
         # 结束并显示结果
@@ -176,14 +259,14 @@ class MeditationGame:
         stages = list(NineStages)
         current_idx = -1
         for i, stage in enumerate(stages):
-            if stage.value == result['stage']:
+            if stage.label == result['stage']:
                 current_idx = i
         
         for i, stage in enumerate(stages):
             if i <= current_idx:
-                print(f"  ✅ {stage.value}")
+                print(f"  ✅ {stage.label}")
             else:
-                print(f"  ⬜ {stage.value}")
+                print(f"  ⬜ {stage.label}")
         
         print()
         input("按 Enter 退出...")
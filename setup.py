@@ -6,14 +6,18 @@ setup(
     description="基于唯识学种子-熏习-现行理论的游戏心理系统引擎",
     author="Todd & Master",
     packages=find_packages(),
-    python_requires=">=3.8",
+    python_requires=">=3.10",
+    install_requires=[
+        "numpy",
+    ],
+    extras_require={
+        "jit": ["numba"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],